@@ -16,13 +16,29 @@ import re
 import json
 import logging
 import argparse
+import functools
+import heapq
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from collections import defaultdict, Counter
+from itertools import chain
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import unicodedata
 
+try:
+    # libyaml (C), bem mais rápido
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import ahocorasick  # pyahocorasick (opcional): busca de frases em passada única
+except ImportError:
+    ahocorasick = None
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,7 +46,112 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+if not yaml.__with_libyaml__:
+    logger.warning("PyYAML sem libyaml: usando parser Python (mais lento). "
+                   "Reinstale o PyYAML com suporte a libyaml para acelerar a leitura")
+
+# Padrões pré-compilados (evita recompilação a cada nota)
+_RE_NONWORD = re.compile(r'[^\w\s]')
+# Mesma limpeza de _RE_NONWORD restrita a ASCII, via str.translate
+_ASCII_NONWORD_TABLE = str.maketrans({c: ' ' for c in range(128) if _RE_NONWORD.match(chr(c))})
+# Blocos Unicode de diacríticos combinantes (acentos após decomposição NFD)
+_RE_COMBINING = re.compile(r'[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+# Frontmatter: '---' na primeira linha até a próxima linha contendo só '---'.
+# O grupo não guloso evita retrocesso quadrático em frontmatter sem fechamento.
+_FM_RE = re.compile(r'\A---\r?\n(?:(.*?)\r?\n)?---[ \t]*(?:\r?\n|\Z)', re.DOTALL)
+_FEEDBACK_FIELD_RE = re.compile(r'\*\*(.+?):\*\* (.+)')
+
+# Abaixo disso, o custo de iniciar processos supera o ganho do parsing paralelo
+_PARALLEL_MIN_FILES = 256
+
+# Campos que definem uma nota com metadados completos
+_REQUIRED_FIELDS = ('area', 'relevancia_cacd')
+
+# Áreas de maior peso na prova (elevam a relevância CACD)
+_HIGH_PRIORITY_AREAS = frozenset({
+    "Política Internacional", "História do Brasil",
+    "DIREITO", "ECONOMIA", "Geografia"
+})
+
+# Mapeia nomes de campos do arquivo de feedback para o frontmatter
+_FEEDBACK_FIELDS = {
+    'área': 'area',
+    'subárea': 'subarea',
+    'tópico': 'topico',
+    'tags': 'tags',
+    'relevância cacd': 'relevancia_cacd',
+    'conexões': 'conexoes'
+}
+
+def _iter_md_files(root: str):
+    """Percorre o vault gerando as entradas (os.DirEntry) dos arquivos .md"""
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        # Pasta ilegível (ex.: sem permissão): pula, como o rglob fazia
+        logger.warning(f"Pasta ignorada ({root}): {e}")
+        return
+    
+    with entries:
+        for entry in entries:
+            # Pula ocultos e templates pelo nome, antes de qualquer stat()
+            if entry.name.startswith('.') or 'template' in entry.name.lower():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_md_files(entry.path)
+            elif entry.name.endswith('.md'):
+                yield entry
+
+def _parse_note(path: str) -> Optional[Tuple[Dict[str, Any], str]]:
+    """Lê um arquivo e separa (frontmatter, conteúdo); roda nos processos do pool"""
+    try:
+        # Leitura binária: normaliza quebras de linha (CRLF/CR) como o modo texto faria
+        with open(path, 'rb') as f:
+            content = f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        
+        frontmatter = {}
+        clean_content = content
+        
+        fm_text, body = _split_frontmatter(content)
+        if fm_text is not None:
+            try:
+                frontmatter = yaml.load(fm_text, Loader=SafeLoader) or {}
+                clean_content = body.strip()
+            except yaml.YAMLError:
+                pass
+        
+        if not isinstance(frontmatter, dict):
+            raise ValueError("frontmatter não é um mapeamento YAML")
+        
+        return frontmatter, clean_content
+        
+    except Exception as e:
+        logger.error(f"Erro ao carregar nota {path}: {e}")
+        return None
+
+def _split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Separa frontmatter e corpo da nota (None se não houver frontmatter)"""
+    match = _FM_RE.match(content)
+    if not match:
+        return None, content
+    
+    # Corpo é fatiado após a linha de fechamento '---'
+    return match.group(1) or '', content[match.end():]
+
+def _is_json_safe(value: Any) -> bool:
+    """Indica se o valor volta idêntico de um ciclo json.dumps/json.loads"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_safe(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_safe(v) for k, v in value.items())
+    return False
+
+# __slots__ nas dataclasses (Python 3.10+): sem __dict__ por instância
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Note:
     """Representa uma nota do vault"""
     id: str
@@ -39,14 +160,20 @@ class Note:
     frontmatter: Dict[str, Any]
     file_path: str
     last_modified: datetime
+    is_complete: bool = field(init=False, default=False)
     
     def __post_init__(self):
         if not self.title and 'title' in self.frontmatter:
             self.title = self.frontmatter['title']
         elif not self.title:
             self.title = Path(self.file_path).stem
+        self.update_completeness()
+    
+    def update_completeness(self):
+        """Atualiza o indicador de metadados completos a partir do frontmatter"""
+        self.is_complete = all(self.frontmatter.get(f) for f in _REQUIRED_FIELDS)
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MetadataSuggestion:
     """Sugestão de metadados para uma nota"""
     note_id: str
@@ -67,96 +194,140 @@ class MetadataSuggestion:
 class CACDTaxonomyAnalyzer:
     """Analisador da taxonomia CACD otimizado para velocidade"""
     
-    def __init__(self, taxonomy_path: str):
+    def __init__(self, taxonomy_path: str, tag_keywords: Set[str] = frozenset()):
         self.taxonomy_path = taxonomy_path
         self.taxonomy = self._load_taxonomy()
         self.keyword_map = self._build_keyword_map()
+        # Palavras-chave de tags (já normalizadas) detectadas na mesma passada
+        self.tag_keywords = frozenset(tag_keywords)
+        self.max_phrase_words = max(
+            (len(p.split()) for p in chain(self.keyword_map, self.tag_keywords)), default=0
+        )
+        self._ac = self._build_phrase_automaton()
         self.areas = list(self.taxonomy.keys())
         
     def _load_taxonomy(self) -> Dict:
         """Carrega a taxonomia CACD"""
         try:
             with open(self.taxonomy_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         except Exception as e:
             logger.error(f"Erro ao carregar taxonomia: {e}")
             return {}
     
-    def _normalize_text(self, text: str) -> str:
+    @staticmethod
+    def _normalize_text(text: str) -> str:
         """Normaliza texto para busca (remove acentos, lowcase)"""
         if not text:
             return ""
-        # Remove acentos
-        text = unicodedata.normalize('NFD', text)
-        text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-        # Converte para minúsculas e remove caracteres especiais
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
+        # Remove acentos (texto ASCII não tem acentos: pula a decomposição)
+        if not text.isascii():
+            text = _RE_COMBINING.sub('', unicodedata.normalize('NFD', text))
+        # Converte para minúsculas (casefold) e remove caracteres especiais:
+        # tabela de tradução para ASCII, regex só se restar algo não-ASCII
+        text = text.casefold().translate(_ASCII_NONWORD_TABLE)
+        if not text.isascii():
+            text = _RE_NONWORD.sub(' ', text)
         # Remove espaços extras
         text = ' '.join(text.split())
         return text
     
-    def _build_keyword_map(self) -> Dict[str, List[Tuple[str, str, str]]]:
-        """Constrói mapa de palavras-chave para classificação rápida"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_term(text: str) -> str:
+        """Normaliza termos curtos da taxonomia e das tags (memoizado; textos de notas não)"""
+        return CACDTaxonomyAnalyzer._normalize_text(text)
+    
+    def _phrase_key(self, text: str) -> str:
+        """Normaliza uma entrada da taxonomia como frase de busca"""
+        words = self._normalize_term(text).split()
+        # Remove artigos iniciais ("O MERCOSUL" -> "mercosul")
+        while words and len(words[0]) <= 2:
+            words.pop(0)
+        return ' '.join(words)
+    
+    def _build_keyword_map(self) -> Dict[str, Tuple[Tuple[str, str, str, int], ...]]:
+        """Constrói mapa de frases da taxonomia para classificação rápida"""
         keyword_map = defaultdict(list)
+        entry_pool = {}  # Compartilha uma única tupla por classificação
+        
+        def add_phrase(text, entry):
+            phrase = self._phrase_key(text)
+            if len(phrase) > 2:  # Ignora frases muito curtas
+                keyword_map[sys.intern(phrase)].append(entry_pool.setdefault(entry, entry))
         
+        # Peso cresce com a profundidade: tópicos são mais específicos que áreas.
+        # Nomes internados: as chaves do Counter de classify_text comparam por identidade
         for area, content in self.taxonomy.items():
-            area_norm = self._normalize_text(area)
-            
-            # Adiciona palavras da área
-            for word in area_norm.split():
-                if len(word) > 2:  # Ignora palavras muito curtas
-                    keyword_map[word].append((area, None, None))
+            area = sys.intern(area)
+            add_phrase(area, (area, None, None, 1))
             
             if isinstance(content, dict):
                 for subarea, topics in content.items():
-                    subarea_norm = self._normalize_text(subarea)
-                    
-                    # Adiciona palavras da subárea
-                    for word in subarea_norm.split():
-                        if len(word) > 2:
-                            keyword_map[word].append((area, subarea, None))
+                    subarea = sys.intern(subarea)
+                    add_phrase(subarea, (area, subarea, None, 2))
                     
                     if isinstance(topics, list):
                         for topic in topics:
                             if isinstance(topic, str):
-                                topic_norm = self._normalize_text(topic)
-                                
-                                # Adiciona palavras do tópico
-                                for word in topic_norm.split():
-                                    if len(word) > 2:
-                                        keyword_map[word].append((area, subarea, topic))
+                                add_phrase(topic, (area, subarea, sys.intern(topic), 3))
+        
+        return {phrase: tuple(entries) for phrase, entries in keyword_map.items()}
+    
+    def _build_phrase_automaton(self):
+        """Constrói autômato Aho-Corasick das frases (None se indisponível)"""
+        if ahocorasick is None or not (self.keyword_map or self.tag_keywords):
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for phrase in self.keyword_map.keys() | self.tag_keywords:
+            # Espaços delimitam a frase para casar apenas palavras inteiras
+            automaton.add_word(f" {phrase} ", phrase)
+        automaton.make_automaton()
+        return automaton
+    
+    def _iter_phrase_matches(self, normalized_text: str):
+        """Percorre as frases conhecidas no texto normalizado, gerando cada ocorrência"""
+        if self._ac is not None:
+            yield from map(itemgetter(1), self._ac.iter(f" {normalized_text} "))
+            return
         
-        return dict(keyword_map)
+        words = normalized_text.split()
+        for i in range(len(words)):
+            for n in range(1, min(self.max_phrase_words, len(words) - i) + 1):
+                phrase = ' '.join(words[i:i + n])
+                if phrase in self.keyword_map or phrase in self.tag_keywords:
+                    yield phrase
     
-    def classify_text(self, text: str, title: str = "") -> Tuple[str, str, str, float]:
-        """Classifica texto usando correspondência de palavras-chave"""
+    def classify_text(self, text: str, title: str = "") -> Tuple[str, str, str, float, Set[str]]:
+        """Classifica texto por frases da taxonomia e coleta palavras-chave de tags"""
         combined_text = f"{title} {text}".strip()
         normalized_text = self._normalize_text(combined_text)
         
         if not normalized_text:
-            return None, None, None, 0.0
+            return None, None, None, 0.0, set()
         
-        words = normalized_text.split()
-        matches = defaultdict(int)
+        # Texto normalizado tem espaços simples: conta palavras sem criar lista
+        num_words = normalized_text.count(' ') + 1
         
-        # Conta correspondências para cada classificação
-        for word in words:
-            if word in self.keyword_map:
-                for area, subarea, topic in self.keyword_map[word]:
-                    key = (area, subarea, topic)
-                    matches[key] += 1
+        # Conta ocorrências de cada frase em C e pondera uma vez por frase distinta
+        phrase_counts = Counter(self._iter_phrase_matches(normalized_text))
+        hits = phrase_counts.keys() & self.tag_keywords
+        matches = Counter()
+        for phrase, count in phrase_counts.items():
+            for area, subarea, topic, weight in self.keyword_map.get(phrase, ()):
+                matches[(area, subarea, topic)] += weight * count
         
         if not matches:
-            return None, None, None, 0.0
+            return None, None, None, 0.0, hits
         
         # Encontra a melhor correspondência
-        best_match = max(matches.items(), key=lambda x: x[1])
-        (area, subarea, topic), score = best_match
+        (area, subarea, topic), score = matches.most_common(1)[0]
         
         # Calcula confiança baseada na pontuação e tamanho do texto
-        confidence = min(score / max(len(words) * 0.1, 1), 1.0)
+        confidence = min(score / max(num_words * 0.1, 1), 1.0)
         
-        return area, subarea, topic, confidence
+        return area, subarea, topic, confidence, hits
 
 class CACDTagGenerator:
     """Gerador de tags específicas para CACD"""
@@ -193,35 +364,52 @@ class CACDTagGenerator:
             "direitos humanos": "direitos-humanos",
             "comércio": "comércio-internacional"
         }
+        
+        # Grupos de palavras que geram tags por padrão temático
+        self.pattern_tags = {
+            "instrumentos-jurídicos": ["tratado", "acordo", "convenção"],
+            "segurança-internacional": ["guerra", "conflito", "paz"],
+            "desenvolvimento-econômico": ["desenvolvimento", "crescimento", "econômico"]
+        }
+        
+        # Regras pré-normalizadas, comparadas com as palavras encontradas no texto
+        normalize = CACDTaxonomyAnalyzer._normalize_term
+        self._keyword_rules = [
+            (normalize(keyword), tag) for keyword, tag in self.keyword_tags.items()
+        ] + [
+            (normalize(word), tag)
+            for tag, words in self.pattern_tags.items() for word in words
+        ]
+        self._area_tag_words = {
+            tag: [normalize(word) for word in tag.split('-')]
+            for tags in self.area_tags.values() for tag in tags
+        }
+    
+    @property
+    def keywords(self) -> Set[str]:
+        """Palavras-chave normalizadas que o classificador deve detectar"""
+        keywords = {keyword for keyword, _ in self._keyword_rules}
+        for words in self._area_tag_words.values():
+            keywords.update(words)
+        return keywords
     
-    def generate_tags(self, text: str, title: str, area: str = None) -> List[str]:
-        """Gera tags relevantes para CACD"""
-        combined_text = f"{title} {text}".lower()
+    def generate_tags(self, hits: Set[str], area: str = None) -> List[str]:
+        """Gera tags relevantes para CACD a partir das palavras-chave encontradas"""
         tags = set()
         
-        # Tags baseadas na área
-        if area and area in self.area_tags:
+        # Tags baseadas na área (uma única consulta ao dicionário)
+        area_words = self.area_tags.get(area) if area else None
+        if area_words:
             # Adiciona 1-2 tags da área se relevantes
-            area_words = self.area_tags[area]
             for tag in area_words[:2]:  # Limita para não sobrecarregar
-                if any(word in combined_text for word in tag.split('-')):
+                if any(word in hits for word in self._area_tag_words[tag]):
                     tags.add(tag)
         
-        # Tags baseadas em palavras-chave específicas
-        for keyword, tag in self.keyword_tags.items():
-            if keyword in combined_text:
+        # Tags baseadas em palavras-chave e padrões específicos do CACD
+        for keyword, tag in self._keyword_rules:
+            if keyword in hits:
                 tags.add(tag)
         
-        # Tags baseadas em padrões específicos do CACD
-        if re.search(r'\b(tratado|acordo|convenção)\b', combined_text):
-            tags.add("instrumentos-jurídicos")
-        
-        if re.search(r'\b(guerra|conflito|paz)\b', combined_text):
-            tags.add("segurança-internacional")
-        
-        if re.search(r'\b(desenvolvimento|crescimento|econômico)\b', combined_text):
-            tags.add("desenvolvimento-econômico")
-        
         return list(tags)[:5]  # Limita a 5 tags para manter relevância
 
 class CACDMetadataAnalyzer:
@@ -232,12 +420,20 @@ class CACDMetadataAnalyzer:
         self.config = config or self._default_config()
         
         # Inicializa componentes
-        self.taxonomy_analyzer = CACDTaxonomyAnalyzer(taxonomy_path)
         self.tag_generator = CACDTagGenerator()
+        self.taxonomy_analyzer = CACDTaxonomyAnalyzer(taxonomy_path, self.tag_generator.keywords)
         
         # Estado interno
         self.notes: Dict[str, Note] = {}
         self.metadata_cache = {}
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._file_stats: Dict[str, Tuple[int, int]] = {}  # id -> (mtime_ns, tamanho)
+        self._notes_by_area: Dict[str, List[Note]] = defaultdict(list)
+        self._notes_by_subarea: Dict[str, List[Note]] = defaultdict(list)
+        self._notes_by_title: Dict[str, Note] = {}
+        
+        # Classificação e tags dependem só de (conteúdo, título): memoiza por instância
+        self._classify_note = functools.lru_cache(maxsize=4096)(self._classify_note_uncached)
         
         logger.info(f"CACD Analyzer inicializado para vault: {vault_path}")
     
@@ -255,71 +451,177 @@ class CACDMetadataAnalyzer:
     
     def scan_vault(self) -> int:
         """Escaneia o vault e carrega notas"""
-        markdown_files = list(self.vault_path.rglob("*.md"))
+        self._cache = self._load_cache()
+        self._file_stats.clear()
         
-        for file_path in markdown_files:
-            # Pula arquivos de sistema
-            if file_path.name.startswith('.') or 'template' in file_path.name.lower():
-                continue
-                
-            try:
-                note = self._load_note(file_path)
-                if note:
-                    self.notes[note.id] = note
-            except Exception as e:
-                logger.warning(f"Erro ao carregar {file_path}: {e}")
+        # Notas inalteradas vêm do cache; as demais são lidas e parseadas
+        entries = list(_iter_md_files(self.vault_path))
+        notes = [self._note_from_cache(entry) for entry in entries]
+        pending = [i for i, note in enumerate(notes) if note is None]
+        
+        parsed = self._parse_files([entries[i].path for i in pending])
+        for i, result in zip(pending, parsed):
+            if result is not None:
+                notes[i] = self._build_note(entries[i], *result)
+        
+        # Mantém a ordem de varredura do vault
+        for note in notes:
+            if note:
+                self.notes[note.id] = note
+        
+        self._build_indexes()
+        self._save_cache()
         
         logger.info(f"Carregadas {len(self.notes)} notas")
         return len(self.notes)
     
-    def _load_note(self, file_path: Path) -> Optional[Note]:
-        """Carrega uma nota individual"""
+    def _cache_path(self) -> Optional[Path]:
+        """Caminho do cache de notas (None se desativado)"""
+        cache_file = self.config.get('cache_file')
+        return self.vault_path / cache_file if cache_file else None
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Carrega o cache de notas da execução anterior"""
+        cache_path = self._cache_path()
+        if not cache_path or not cache_path.exists():
+            return {}
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extrai frontmatter
-            frontmatter = {}
-            clean_content = content
-            
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    try:
-                        frontmatter = yaml.safe_load(parts[1]) or {}
-                        clean_content = parts[2].strip()
-                    except yaml.YAMLError:
-                        pass
-            
-            # Cria ID relativo ao vault
-            note_id = str(file_path.relative_to(self.vault_path))
-            
-            return Note(
-                id=note_id,
-                title=frontmatter.get('title', file_path.stem),
-                content=clean_content,
-                frontmatter=frontmatter,
-                file_path=str(file_path),
-                last_modified=datetime.fromtimestamp(file_path.stat().st_mtime)
-            )
-            
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                raise ValueError("conteúdo não é um objeto JSON")
+            return cache
+        except Exception as e:
+            logger.warning(f"Cache ignorado ({cache_path}): {e}")
+            return {}
+    
+    def _save_cache(self):
+        """Salva o cache das notas carregadas, indexado pelo ID"""
+        cache_path = self._cache_path()
+        if not cache_path:
+            return
+        
+        # Notas com frontmatter fora do JSON (datas, chaves não-str) ficam fora
+        # do cache e são relidas do arquivo na próxima execução
+        cache = {
+            note.id: {
+                'mtime_ns': self._file_stats[note.id][0],
+                'size': self._file_stats[note.id][1],
+                'title': note.title,
+                'frontmatter': note.frontmatter,
+                'content': note.content
+            }
+            for note in self.notes.values()
+            if note.id in self._file_stats
+            and _is_json_safe(note.title) and _is_json_safe(note.frontmatter)
+        }
+        
+        # Serializa antes de abrir e troca o arquivo atomicamente: sem cache truncado
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            data = json.dumps(cache, ensure_ascii=False, separators=(',', ':'))
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
         except Exception as e:
-            logger.error(f"Erro ao carregar nota {file_path}: {e}")
+            logger.warning(f"Erro ao salvar cache {cache_path}: {e}")
+    
+    def _build_indexes(self):
+        """Indexa as notas por área, subárea e título"""
+        self._notes_by_area.clear()
+        self._notes_by_subarea.clear()
+        self._notes_by_title.clear()
+        
+        for note in self.notes.values():
+            # Títulos repetidos: mantém a primeira nota, como na busca linear.
+            # Títulos do feedback são sempre str: os demais ficam fora do índice
+            if isinstance(note.title, str):
+                self._notes_by_title.setdefault(note.title, note)
+            
+            # Só valores str podem igualar a área/subárea sugerida (listas não são hasheáveis)
+            fm = note.frontmatter
+            area, subarea = fm.get('area'), fm.get('subarea')
+            if area and isinstance(area, str):
+                self._notes_by_area[area].append(note)
+            if subarea and isinstance(subarea, str):
+                self._notes_by_subarea[subarea].append(note)
+    
+    def _parse_files(self, paths: List[str]) -> List[Optional[Tuple[Dict[str, Any], str]]]:
+        """Executa _parse_note sobre os arquivos, em paralelo quando compensa"""
+        if len(paths) < _PARALLEL_MIN_FILES:
+            return [_parse_note(path) for path in paths]
+        
+        # Import tardio: multiprocessing só é carregado quando o vault é grande
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        
+        # YAML é CPU-bound: processos escapam do GIL (chunksize amortiza o IPC)
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                return list(executor.map(_parse_note, paths, chunksize=32))
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning(f"Pool de processos indisponível ({e}), usando threads")
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(_parse_note, paths))
+    
+    def _note_id(self, entry: os.DirEntry) -> str:
+        """ID da nota: caminho relativo ao vault"""
+        return str(Path(entry.path).relative_to(self.vault_path))
+    
+    def _note_from_cache(self, entry: os.DirEntry) -> Optional[Note]:
+        """Reconstrói a nota do cache se o arquivo não mudou desde a última execução"""
+        note_id = self._note_id(entry)
+        cached = self._cache.get(note_id)
+        # Arquivo fica no vault (pode ser editado/sincronizado): entrada malformada é miss
+        if not (isinstance(cached, dict)
+                and all(key in cached for key in ('mtime_ns', 'size', 'title', 'content'))
+                and isinstance(cached.get('frontmatter'), dict)):
+            return None
+        
+        try:
+            # DirEntry.stat() fica em cache na própria entrada (sem stat repetido)
+            stat = entry.stat()
+        except OSError:
             return None
+        
+        # Arquivo inalterado: mesma data de modificação (ns) e mesmo tamanho
+        if (cached.get('mtime_ns'), cached.get('size')) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        
+        self._file_stats[note_id] = (stat.st_mtime_ns, stat.st_size)
+        return Note(
+            id=note_id,
+            title=cached['title'],
+            content=cached['content'],
+            frontmatter=cached['frontmatter'],
+            file_path=entry.path,
+            last_modified=datetime.fromtimestamp(stat.st_mtime)
+        )
+    
+    def _build_note(self, entry: os.DirEntry, frontmatter: Dict[str, Any], content: str) -> Note:
+        """Cria a nota a partir do resultado de _parse_note"""
+        note_id = self._note_id(entry)
+        stat = entry.stat()
+        self._file_stats[note_id] = (stat.st_mtime_ns, stat.st_size)
+        
+        return Note(
+            id=note_id,
+            title=frontmatter.get('title', Path(entry.name).stem),
+            content=content,
+            frontmatter=frontmatter,
+            file_path=entry.path,
+            last_modified=datetime.fromtimestamp(stat.st_mtime)
+        )
     
     def analyze_note(self, note: Note) -> MetadataSuggestion:
         """Analisa uma nota e gera sugestões de metadados"""
         # Verifica se já tem metadados completos
-        if self._has_complete_metadata(note):
+        if note.is_complete:
             return MetadataSuggestion(note_id=note.id, confidence=1.0)
         
-        # Análise de classificação
-        area, subarea, topico, confidence = self.taxonomy_analyzer.classify_text(
-            note.content, note.title
-        )
-        
-        # Geração de tags
-        tags = self.tag_generator.generate_tags(note.content, note.title, area)
+        # Classificação e tags (memoizadas para conteúdo já analisado; título pode não ser str)
+        area, subarea, topico, confidence, tags = self._classify_note(note.content, str(note.title))
         
         # Cálculo de relevância CACD
         relevancia = self._calculate_relevancia_cacd(note, area, confidence)
@@ -332,17 +634,20 @@ class CACDMetadataAnalyzer:
             area=area,
             subarea=subarea,
             topico=topico,
-            tags=tags,
+            tags=list(tags),
             relevancia_cacd=relevancia,
             conexoes=conexoes,
             confidence=confidence
         )
     
-    def _has_complete_metadata(self, note: Note) -> bool:
-        """Verifica se a nota já tem metadados completos"""
-        fm = note.frontmatter
-        required_fields = ['area', 'relevancia_cacd']
-        return all(field in fm and fm[field] for field in required_fields)
+    def _classify_note_uncached(self, content: str, title: str) -> Tuple[str, str, str, float, Tuple[str, ...]]:
+        """Classifica o texto e gera as tags correspondentes"""
+        area, subarea, topico, confidence, hits = self.taxonomy_analyzer.classify_text(content, title)
+        
+        # Geração de tags (reaproveita as palavras-chave da classificação)
+        tags = tuple(self.tag_generator.generate_tags(hits, area))
+        
+        return area, subarea, topico, confidence, tags
     
     def _calculate_relevancia_cacd(self, note: Note, area: str, confidence: float) -> int:
         """Calcula relevância para o CACD (1-5)"""
@@ -353,12 +658,7 @@ class CACDMetadataAnalyzer:
         base_score = 3  # Pontuação base
         
         # Ajusta baseado na área (algumas são mais importantes)
-        high_priority_areas = [
-            "Política Internacional", "História do Brasil", 
-            "DIREITO", "ECONOMIA", "Geografia"
-        ]
-        
-        if area in high_priority_areas:
+        if area in _HIGH_PRIORITY_AREAS:
             base_score += 1
         
         # Ajusta baseado na confiança
@@ -379,34 +679,37 @@ class CACDMetadataAnalyzer:
     def _suggest_connections(self, note: Note, area: str, subarea: str) -> List[str]:
         """Sugere conexões com outras notas"""
         connections = []
-        note_words = set(self.taxonomy_analyzer._normalize_text(
-            f"{note.title} {note.content}"
-        ).split())
+        max_connections = self.config['conexoes_max']
+        seen = {note.id}
+        
+        # Candidatas de mesma área/subárea vêm direto dos índices
+        candidates = chain(
+            self._notes_by_area.get(area, ()),
+            self._notes_by_subarea.get(subarea, ())
+        )
         
-        for other_note_id, other_note in self.notes.items():
-            if other_note_id == note.id:
+        for other_note in candidates:
+            if other_note.id in seen:
                 continue
+            seen.add(other_note.id)
             
-            # Verifica similaridade de área/subárea
-            other_area = other_note.frontmatter.get('area')
-            other_subarea = other_note.frontmatter.get('subarea')
-            
-            if other_area == area or other_subarea == subarea:
-                connections.append(other_note.title)
-                if len(connections) >= self.config['conexoes_max']:
-                    break
+            connections.append(other_note.title)
+            if len(connections) >= max_connections:
+                break
         
         return connections
     
     def generate_feedback_file(self) -> bool:
         """Gera arquivo de feedback para revisão manual"""
-        suggestions_to_review = []
+        incomplete_notes = [note for note in self.notes.values() if not note.is_complete]
+        suggestions = [self.analyze_note(note) for note in incomplete_notes]
         
-        for note in self.notes.values():
-            if not self._has_complete_metadata(note):
-                suggestion = self.analyze_note(note)
-                if suggestion.area:  # Só inclui se houve sugestão
-                    suggestions_to_review.append(suggestion)
+        # Pares (nota, sugestão): só inclui se houve sugestão
+        suggestions_to_review = [
+            (note, suggestion)
+            for note, suggestion in zip(incomplete_notes, suggestions)
+            if suggestion.area
+        ]
         
         if not suggestions_to_review:
             logger.info("Todas as notas já possuem metadados completos")
@@ -420,8 +723,7 @@ class CACDMetadataAnalyzer:
                 f.write(f"Gerado em: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
                 f.write("**Instruções:** Marque com [x] para aprovar, [ ] para rejeitar\n\n")
                 
-                for suggestion in suggestions_to_review:
-                    note = self.notes[suggestion.note_id]
+                for note, suggestion in suggestions_to_review:
                     f.write(f"## Nota: {note.title}\n")
                     f.write(f"**Arquivo:** `{suggestion.note_id}`\n")
                     f.write(f"**Confiança:** {suggestion.confidence:.2f}\n\n")
@@ -476,33 +778,25 @@ class CACDMetadataAnalyzer:
             current_note = None
             approved_changes = defaultdict(dict)
             
-            for line in content.split('\n'):
+            lines = content.split('\n')
+            
+            for i, line in enumerate(lines):
                 # Identifica nota atual
                 if line.startswith('## Nota:'):
                     current_note = line.replace('## Nota:', '').strip()
                 
                 # Processa aprovações
                 elif '- Decisão: [x]' in line:
-                    prev_line = content.split('\n')[content.split('\n').index(line) - 1]
+                    prev_line = lines[i - 1] if i > 0 else ''
                     
                     if current_note and '**' in prev_line:
-                        field_match = re.search(r'\*\*(.+?):\*\* (.+)', prev_line)
+                        field_match = _FEEDBACK_FIELD_RE.search(prev_line)
                         if field_match:
                             field_name = field_match.group(1).lower()
                             field_value = field_match.group(2)
                             
-                            # Mapeia nomes de campos
-                            field_mapping = {
-                                'área': 'area',
-                                'subárea': 'subarea', 
-                                'tópico': 'topico',
-                                'tags': 'tags',
-                                'relevância cacd': 'relevancia_cacd',
-                                'conexões': 'conexoes'
-                            }
-                            
-                            if field_name in field_mapping:
-                                mapped_field = field_mapping[field_name]
+                            mapped_field = _FEEDBACK_FIELDS.get(field_name)
+                            if mapped_field:
                                 
                                 # Processa valor baseado no tipo
                                 if mapped_field == 'tags':
@@ -539,10 +833,7 @@ class CACDMetadataAnalyzer:
     
     def _find_note_by_title(self, title: str) -> Optional[Note]:
         """Encontra nota pelo título"""
-        for note in self.notes.values():
-            if note.title == title:
-                return note
-        return None
+        return self._notes_by_title.get(title)
     
     def _apply_metadata_changes(self, note: Note, changes: Dict) -> bool:
         """Aplica mudanças de metadados a uma nota"""
@@ -561,36 +852,32 @@ class CACDMetadataAnalyzer:
                 content = f.read()
             
             # Atualiza frontmatter
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    try:
-                        frontmatter = yaml.safe_load(parts[1]) or {}
-                    except yaml.YAMLError:
-                        frontmatter = {}
-                    main_content = parts[2]
-                else:
+            frontmatter = {}
+            fm_text, main_content = _split_frontmatter(content)
+            if fm_text is not None:
+                try:
+                    frontmatter = yaml.load(fm_text, Loader=SafeLoader) or {}
+                except yaml.YAMLError:
                     frontmatter = {}
-                    main_content = content
-            else:
-                frontmatter = {}
-                main_content = content
             
             # Aplica mudanças
             frontmatter.update(changes)
             
-            # Reconstrói arquivo
-            new_content = "---\n"
-            new_content += yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
-            new_content += "---\n"
-            new_content += main_content
+            # Serializa antes de abrir o arquivo (erro não deixa a nota truncada)
+            frontmatter_yaml = yaml.dump(
+                frontmatter, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True
+            )
             
-            # Salva
+            # Salva, escrevendo as partes direto no arquivo
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+                f.write("---\n")
+                f.write(frontmatter_yaml)
+                f.write("---\n")
+                f.write(main_content)
             
             # Atualiza nota em memória
             note.frontmatter.update(changes)
+            note.update_completeness()
             
             logger.debug(f"Metadados atualizados para: {note.title}")
             return True
@@ -603,23 +890,28 @@ class CACDMetadataAnalyzer:
         """Gera relatório de estudos baseado nos metadados"""
         report_path = self.vault_path / "cacd_study_report.md"
         
-        # Coleta estatísticas
-        area_stats = defaultdict(int)
-        relevancia_stats = defaultdict(int)
-        total_notes = len(self.notes)
-        notes_with_metadata = 0
-        
-        for note in self.notes.values():
-            fm = note.frontmatter
-            if fm.get('area'):
-                notes_with_metadata += 1
-                area_stats[fm['area']] += 1
-            
-            if fm.get('relevancia_cacd'):
-                relevancia_stats[fm['relevancia_cacd']] += 1
-        
-        # Gera relatório
         try:
+            # Coleta estatísticas (passada única sobre as notas); valores
+            # inválidos no frontmatter caem no tratamento de erro abaixo
+            area_stats = Counter()
+            relevancia_stats = Counter()
+            high_relevance_notes = []
+            total_notes = len(self.notes)
+            notes_with_metadata = 0
+            
+            for note in self.notes.values():
+                fm = note.frontmatter
+                if fm.get('area'):
+                    notes_with_metadata += 1
+                    area_stats[fm['area']] += 1
+                
+                relevancia = fm.get('relevancia_cacd')
+                if relevancia:
+                    relevancia_stats[relevancia] += 1
+                    if relevancia >= 4:
+                        high_relevance_notes.append(note)
+            
+            # Gera relatório
             with open(report_path, 'w', encoding='utf-8') as f:
                 f.write("# Relatório de Estudos CACD\n\n")
                 f.write(f"**Gerado em:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
@@ -630,7 +922,7 @@ class CACDMetadataAnalyzer:
                 f.write(f"- **Cobertura:** {notes_with_metadata/total_notes*100:.1f}%\n\n")
                 
                 f.write("## Distribuição por Área\n\n")
-                for area, count in sorted(area_stats.items(), key=lambda x: x[1], reverse=True):
+                for area, count in area_stats.most_common():
                     percentage = count / notes_with_metadata * 100
                     f.write(f"- **{area}:** {count} notas ({percentage:.1f}%)\n")
                 
@@ -654,16 +946,10 @@ class CACDMetadataAnalyzer:
                     f.write("\n")
                 
                 # Notas de alta relevância para revisão
-                high_relevance_notes = [
-                    note for note in self.notes.values() 
-                    if note.frontmatter.get('relevancia_cacd', 0) >= 4
-                ]
-                
                 if high_relevance_notes:
                     f.write("### Notas de Alta Relevância para Revisão:\n")
-                    for note in sorted(high_relevance_notes, 
-                                     key=lambda x: x.frontmatter.get('relevancia_cacd', 0), 
-                                     reverse=True)[:10]:
+                    for note in heapq.nlargest(10, high_relevance_notes,
+                                               key=lambda x: x.frontmatter['relevancia_cacd']):
                         rel = note.frontmatter.get('relevancia_cacd', 0)
                         area = note.frontmatter.get('area', 'N/A')
                         f.write(f"- **{note.title}** (Rel: {rel}, Área: {area})\n")
@@ -709,6 +995,7 @@ def main():
         "max_tags": 5,
         "conexoes_max": 3,
         "feedback_file": "cacd_feedback.md",
+        "cache_file": ".cacd_cache.json",
         "backup_original": True
     }
     
@@ -9,45 +9,69 @@ import os
 import sys
 import tempfile
 import shutil
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+# Taxonomia de teste simplificada, já serializada em YAML
+TEST_TAXONOMY_YAML = """\
+História do Brasil:
+  O período colonial:
+  - A configuração territorial
+  - As dimensões econômicas
+  O Segundo Reinado (1840-1889):
+  - Política externa
+  - A questão da escravidão
+História Mundial:
+  Revoluções:
+  - A Revolução Francesa
+  - Revoluções no século XX
+  As relações internacionais:
+  - O Concerto Europeu
+  - A Guerra Fria
+Política Internacional:
+  O Brasil e a América do Sul:
+  - Integração na América do Sul
+  - O MERCOSUL
+  Estados Unidos da América: []
+Geografia:
+  Geografia política:
+  - Teorias geopolíticas
+  - Relações Estado e território
+  Geografia Urbana:
+  - Processo de urbanização
+  - Metropolização
+ECONOMIA:
+  Microeconomia:
+  - Demanda do Consumidor
+  - Oferta do Produtor
+  Macroeconomia:
+  - Contabilidade Nacional
+  - Política monetária
+"""
+
+def _write_file(path: Path, data: bytes):
+    """Grava o buffer inteiro direto com os.write, sem objeto de arquivo"""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def create_test_vault(base_path: Path):
     """Cria um vault de teste com notas de exemplo"""
     base_path.mkdir(parents=True, exist_ok=True)
     
     # Criar taxonomia de teste simplificada
-    test_taxonomy = {
-        "História do Brasil": {
-            "O período colonial": ["A configuração territorial", "As dimensões econômicas"],
-            "O Segundo Reinado (1840-1889)": ["Política externa", "A questão da escravidão"]
-        },
-        "História Mundial": {
-            "Revoluções": ["A Revolução Francesa", "Revoluções no século XX"],
-            "As relações internacionais": ["O Concerto Europeu", "A Guerra Fria"]
-        },
-        "Política Internacional": {
-            "O Brasil e a América do Sul": ["Integração na América do Sul", "O MERCOSUL"],
-            "Estados Unidos da América": []
-        },
-        "Geografia": {
-            "Geografia política": ["Teorias geopolíticas", "Relações Estado e território"],
-            "Geografia Urbana": ["Processo de urbanização", "Metropolização"]
-        },
-        "ECONOMIA": {
-            "Microeconomia": ["Demanda do Consumidor", "Oferta do Produtor"],
-            "Macroeconomia": ["Contabilidade Nacional", "Política monetária"]
-        }
-    }
-    
-    with open(base_path / "taxonomia_cacd.yaml", 'w', encoding='utf-8') as f:
-        yaml.dump(test_taxonomy, f, default_flow_style=False, allow_unicode=True)
+    _write_file(base_path / "taxonomia_cacd.yaml", TEST_TAXONOMY_YAML.encode('utf-8'))
     
     # Criar notas de teste
     test_notes = [
         {
             "filename": "revolucao-francesa.md",
-            "frontmatter": {"title": "A Revolução Francesa"},
+            "frontmatter": "title: A Revolução Francesa\n",
             "content": """
 A Revolução Francesa (1789-1799) foi um período de intensa transformação política e social na França. 
 Marcou o fim do Antigo Regime e estabeleceu princípios democráticos que influenciaram o mundo todo.
@@ -68,11 +92,11 @@ A revolução inspirou movimentos liberais em toda a Europa e nas Américas.
         },
         {
             "filename": "guerra-do-paraguai.md",
-            "frontmatter": {
-                "title": "Guerra do Paraguai",
-                "area": "História do Brasil",
-                "relevancia_cacd": 5
-            },
+            "frontmatter": (
+                "title: Guerra do Paraguai\n"
+                "area: História do Brasil\n"
+                "relevancia_cacd: 5\n"
+            ),
             "content": """
 A Guerra do Paraguai (1864-1870) foi o maior conflito da América do Sul.
 
@@ -93,7 +117,7 @@ A Guerra do Paraguai (1864-1870) foi o maior conflito da América do Sul.
         },
         {
             "filename": "mercosul-origem.md",
-            "frontmatter": {"title": "Origens do MERCOSUL"},
+            "frontmatter": "title: Origens do MERCOSUL\n",
             "content": """
 O Mercado Comum do Sul (MERCOSUL) teve origem nos acordos bilaterais entre Brasil e Argentina.
 
@@ -117,7 +141,7 @@ Estabeleceu as bases do MERCOSUL com quatro países fundadores:
         },
         {
             "filename": "urbanizacao-brasil.md",
-            "frontmatter": {},
+            "frontmatter": "",
             "content": """
 A urbanização no Brasil acelerou-se principalmente após 1950.
 
@@ -141,7 +165,7 @@ O processo de metropolização criou complexas redes urbanas no território bras
         },
         {
             "filename": "politica-monetaria.md",
-            "frontmatter": {"title": "Política Monetária no Brasil"},
+            "frontmatter": "title: Política Monetária no Brasil\n",
             "content": """
 A política monetária é conduzida pelo Banco Central do Brasil.
 
@@ -164,20 +188,23 @@ A política monetária interage com a política fiscal para determinar os result
         }
     ]
     
-    # Criar arquivos das notas
+    # Criar arquivos das notas (frontmatter já em YAML), um buffer por arquivo
     for note in test_notes:
-        content = ""
+        buf = note["content"].encode('utf-8')
         if note["frontmatter"]:
-            content += "---\n"
-            content += yaml.dump(note["frontmatter"], default_flow_style=False, allow_unicode=True)
-            content += "---\n"
-        content += note["content"]
+            buf = b"---\n" + note["frontmatter"].encode('utf-8') + b"---\n" + buf
         
-        with open(base_path / note["filename"], 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_file(base_path / note["filename"], buf)
     
     return base_path
 
+def _read_preview(path, max_lines: int):
+    """Lê as primeiras linhas de um arquivo (vazio se o arquivo não foi gerado)"""
+    if not path:
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(islice(f, max_lines))
+
 def test_analyzer(vault_path: Path, taxonomy_path: Path):
     """Testa o analisador CACD"""
     print(f"🧪 Testando CACD Analyzer...")
@@ -210,31 +237,35 @@ def test_analyzer(vault_path: Path, taxonomy_path: Path):
             print(f"   - Relevância: {suggestion.relevancia_cacd}")
             print(f"   - Confiança: {suggestion.confidence:.2f}")
         
-        # Testa geração de feedback
+        # Testa geração de feedback e de relatório
+        feedback_file = None
         if cacd_analyzer.generate_feedback_file():
             feedback_file = vault_path / "cacd_feedback.md"
+        report_path = cacd_analyzer.generate_study_report()
+        
+        # Lê os previews dos dois arquivos em paralelo (20 e 15 primeiras linhas)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            feedback_lines, report_lines = executor.map(
+                _read_preview, (feedback_file, report_path), (20, 15)
+            )
+        
+        if feedback_file:
             print(f"✅ Arquivo de feedback gerado: {feedback_file}")
             
             # Mostra preview do feedback
-            with open(feedback_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[:20]  # Primeiras 20 linhas
-                print("📄 Preview do feedback:")
-                for line in lines:
-                    print(f"   {line.rstrip()}")
-                if len(lines) == 20:
-                    print("   ...")
+            print("📄 Preview do feedback:")
+            for line in feedback_lines:
+                print(f"   {line.rstrip()}")
+            if len(feedback_lines) == 20:
+                print("   ...")
         
-        # Testa geração de relatório
-        report_path = cacd_analyzer.generate_study_report()
         if report_path:
             print(f"✅ Relatório gerado: {report_path}")
             
             # Mostra preview do relatório
-            with open(report_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()[:15]
-                print("📊 Preview do relatório:")
-                for line in lines:
-                    print(f"   {line.rstrip()}")
+            print("📊 Preview do relatório:")
+            for line in report_lines:
+                print(f"   {line.rstrip()}")
         
         print(f"\n🎉 Teste concluído com sucesso!")
         return True
@@ -269,7 +300,8 @@ def main():
         print(f"\n📁 Vault de teste criado em: {vault_path}")
         
         # Lista arquivos criados
-        files = list(vault_path.glob("*.md")) + list(vault_path.glob("*.yaml"))
+        with os.scandir(vault_path) as it:
+            files = [entry for entry in it if entry.name.endswith(('.md', '.yaml'))]
         print(f"📄 Arquivos criados: {len(files)}")
         for file in files:
             print(f"   - {file.name}")
@@ -40,7 +40,7 @@ if [ -f "$SCRIPT_DIR/requirements.txt" ]; then
     echo "✅ Dependências instaladas via requirements.txt"
 else
     echo "⚠️  requirements.txt não encontrado, instalando manualmente..."
-    python3 -m pip install --user PyYAML
+    python3 -m pip install --user PyYAML pyahocorasick
 fi
 
 # Copiar arquivos do projeto